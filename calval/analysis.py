@@ -1,8 +1,31 @@
 import warnings
+import functools
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 from pyspectral.solar import SolarIrradianceSpectrum, TOTAL_IRRADIANCE_SPECTRUM_2000ASTM
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+if numba is not None:
+    # no fastmath: it would let LLVM assume NaNs away and break the v == v test
+    @numba.njit(parallel=True, cache=True)
+    def _fused_integrate(mat, srf_vec, out):
+        # nan->0 substitution fused into the dot product, so no intermediate
+        # matrix copy is needed (NaN != NaN, hence the v == v test)
+        for i in numba.prange(mat.shape[0]):
+            acc = np.float32(0.0)
+            for j in range(mat.shape[1]):
+                v = mat[i, j]
+                if v == v:
+                    acc += v * srf_vec[j]
+            out[i] = acc
+else:  # pragma: no cover
+    _fused_integrate = None
 
 
 def integrate(site_measurements, srf):
@@ -12,17 +35,54 @@ def integrate(site_measurements, srf):
     :param srf: SRF
     :return: 4x TimeSeries: toa, toa_errs, sr, sr_errs
     """
-    def _integrate(measurements_df, srf):
-        measured_spectrum = [float(c) for c in measurements_df.columns]
-        srf_interpolated = np.nan_to_num(srf(measured_spectrum))  # interpolated to wavelengths of site measurements
-        integrated_values = {time: np.dot(srf_interpolated, np.nan_to_num(row.values))
-                             for time, row in measurements_df.iterrows()}
-        return pd.Series(data=integrated_values).astype(np.float32)
-
-    return [_integrate(getattr(site_measurements, data), srf)
+    def _integrate(measurements_df, srf_interpolated):
+        # single-precision all the way through: the output is float32 anyway,
+        # and a contiguous float32 matrix halves the bandwidth of the matmul
+        if _fused_integrate is not None:
+            mat = np.ascontiguousarray(measurements_df.to_numpy(dtype=np.float32))
+            integrated_values = np.empty(mat.shape[0], dtype=np.float32)
+            _fused_integrate(mat, srf_interpolated, integrated_values)
+        else:
+            # one owned copy, NaNs scrubbed in place - no second full-size temporary
+            mat = measurements_df.to_numpy(dtype=np.float32, copy=True)
+            np.nan_to_num(mat, copy=False)
+            integrated_values = mat @ srf_interpolated
+        # integrated_values is already float32; the explicit dtype documents the
+        # contract without copying
+        return pd.Series(data=integrated_values, index=measurements_df.index, dtype=np.float32)
+
+    columns = site_measurements.toa.columns
+    assert all(getattr(site_measurements, data).columns.equals(columns)
+               for data in ['toa_errs', 'sr', 'sr_errs']), 'measurement frames should share wavelength columns'
+    measured_spectrum = columns.to_numpy(dtype=np.float64)
+    # interpolated to wavelengths of site measurements
+    srf_interpolated = srf(measured_spectrum).astype(np.float32)
+    np.nan_to_num(srf_interpolated, copy=False)
+    return [_integrate(getattr(site_measurements, data), srf_interpolated)
             for data in ['toa', 'toa_errs', 'sr', 'sr_errs']]
 
 
+@functools.lru_cache(maxsize=8)
+def _solar_grid(dlambda_nm, start_nm, end_nm):
+    """
+    Interpolated solar spectrum: (wavelengths in nm, irradiance in [W/(m^2 um)]).
+    Cached, since callers typically sweep many SRFs over the same grid.
+    """
+    srr = SolarIrradianceSpectrum(TOTAL_IRRADIANCE_SPECTRUM_2000ASTM, dlambda=dlambda_nm/1000)
+    srr.interpolate(ival_wavelength=(start_nm/1000, end_nm/1000))
+    return srr.ipol_wavelength * 1000, srr.ipol_irradiance
+
+
+def _band_average(response, values):
+    # restrict to the support of the response, which is usually a small
+    # fraction of the full solar grid (does not change the weighted average)
+    support = np.flatnonzero(response)
+    if support.size and support.size < response.size:
+        window = slice(support[0], support[-1] + 1)
+        response, values = response[window], values[window]
+    return np.dot(response, values) / np.sum(response)
+
+
 def exatmospheric_irradiance(srf, dlambda_nm=0.5, start_nm=200.0, end_nm=2000.0):
     """
     Compute the exatmospheric solar irradiance of some sensor (band) at 1a.u.
@@ -33,12 +93,8 @@ def exatmospheric_irradiance(srf, dlambda_nm=0.5, start_nm=200.0, end_nm=2000.0)
     warnings.warn(DeprecationWarning(
         '`exatmospheric_irradiance` is scheduled to be removed, '
         'use `srf_exatmospheric_irradiance` (nm based units) instead.'))
-    srr = SolarIrradianceSpectrum(TOTAL_IRRADIANCE_SPECTRUM_2000ASTM, dlambda=dlambda_nm/1000)
-    srr.interpolate(ival_wavelength=(start_nm/1000, end_nm/1000))
-    lambdas = srr.ipol_wavelength * 1000
-    response = srf(lambdas)
-    avg = np.dot(response, srr.ipol_irradiance) / np.sum(response)
-    return avg
+    lambdas, irradiance = _solar_grid(dlambda_nm, start_nm, end_nm)
+    return _band_average(srf(lambdas), irradiance)
 
 
 def srf_exatmospheric_irradiance(srf, dlambda_nm=0.5, start_nm=200.0, end_nm=2000.0):
@@ -48,13 +104,8 @@ def srf_exatmospheric_irradiance(srf, dlambda_nm=0.5, start_nm=200.0, end_nm=200
     `dlambda_nm`, `start_nm`, `end_nm`: interpolation parameters for the solar spectrum
     :return: band irradiance at 1au, in [W/(m^2 nm)]
     """
-    srr = SolarIrradianceSpectrum(TOTAL_IRRADIANCE_SPECTRUM_2000ASTM, dlambda=dlambda_nm/1000)
-    srr.interpolate(ival_wavelength=(start_nm/1000, end_nm/1000))
-    lambdas = srr.ipol_wavelength * 1000
-    values = srr.ipol_irradiance / 1000.0
-    response = srf(lambdas)
-    avg = np.dot(response, values) / np.sum(response)
-    return avg
+    lambdas, irradiance = _solar_grid(dlambda_nm, start_nm, end_nm)
+    return _band_average(srf(lambdas), irradiance / 1000.0)
 
 
 def plot(types, site_measurements, srfs, with_errors=True, fig=None, show=True):
@@ -69,24 +120,33 @@ def plot(types, site_measurements, srfs, with_errors=True, fig=None, show=True):
     :return: plt figure
     """
 
-    def _plot(data, err, with_errors, label):
+    def _plot(x_num, data, err, with_errors, label):
         if with_errors:
-            artists = plt.errorbar(data.index.values, data.values, yerr=err)
+            artists = plt.errorbar(x_num, data.values, yerr=err)
             artists.lines[0].set_label(label)
         else:
-            artists = plt.plot(data.index.values, data.values)
+            artists = plt.plot(x_num, data.values)
             artists[0].set_label(label)
 
     if fig is None:
         fig = plt.figure()
-    for srf in srfs:
-        # for type in types:
-        if 'toa' in types or 'toa' == types:
-            data, err = integrate(site_measurements, srf)[:2]
-            _plot(data, err, with_errors=with_errors, label='%s %s TOA' % (srf.satellite, srf.band))
-        if 'sr' in types or 'sr' == types:
-            data, err = integrate(site_measurements, srf)[2:4]
-            _plot(data, err, with_errors=with_errors, label='%s %s SR' % (srf.satellite, srf.band))
+    types = {types} if isinstance(types, str) else set(types)
+    # empty measurement frames produce nothing to draw, so don't integrate them
+    types = {name for name in types if not getattr(site_measurements, name).empty}
+    # convert the datetime axis to matplotlib numbers once per type, instead of
+    # having every plot call re-detect the date units
+    x_nums = {name: mdates.date2num(getattr(site_measurements, name).index.to_pydatetime())
+              for name in types}
+    entries = []
+    for srf in (srfs if types else []):
+        series = integrate(site_measurements, srf)
+        if 'toa' in types:
+            entries.append([x_nums['toa']] + series[:2] + ['%s %s TOA' % (srf.satellite, srf.band)])
+        if 'sr' in types:
+            entries.append([x_nums['sr']] + series[2:4] + ['%s %s SR' % (srf.satellite, srf.band)])
+    for x_num, data, err, label in entries:
+        _plot(x_num, data, err, with_errors=with_errors, label=label)
+    plt.gca().xaxis_date()
 
     fig.autofmt_xdate()
     plt.title('Reflectance in %s' % site_measurements.meta['site'])
@@ -6,12 +6,16 @@ scene_id and sceneset_id can be either normalized or provider-specific (provider
 scene_id are useful when using provider-specific storage backend).
 """
 import os
-import glob
 from collections import namedtuple
-from functools import total_ordering
+from functools import total_ordering, lru_cache
 import json
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 import datetime as dt
 import urllib.request
+from concurrent import futures
 import telluric as tl
 from calval.utils import cached_property
 from calval.raster_utils import hires_tile, TileCache, uncached_get_tile, asfloat
@@ -19,6 +23,17 @@ from calval.raster_utils import hires_tile, TileCache, uncached_get_tile, asfloa
 band_names = ['blue', 'green', 'red', 'nir']
 tile_cache = TileCache()
 
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(s):
+    """
+    Fixed-width fast path for the default '%Y%m%d%H%M' timestamp format
+    (strptime is an order of magnitude slower, which shows when decoding
+    many scene-id strings). Cached, since indexing re-parses duplicates.
+    """
+    return dt.datetime(int(s[:4]), int(s[4:6]), int(s[6:8]), int(s[8:10]), int(s[10:12]))
+
+
 sceneid_params = namedtuple('sceneid_params', ['product', 'satellite', 'tile_id', 'timestamp', 'tag'])
 sceneid_params.__new__.__defaults__ = ('0',)  # default tag
 scenesetid_params = namedtuple('scenesetid_params', ['satellite', 'tile_id', 'timestamp'])
@@ -38,6 +53,14 @@ class StringableTuple:
 
     def __init__(self, *args, **kwargs):
         self.params = self.tuple_type(*args, **kwargs)
+        # expose the fields as plain attributes, so hot paths (sceneset_id,
+        # dir_path) don't go through __getattr__ dispatch on every access
+        for field, value in zip(self.tuple_type._fields, self.params):
+            setattr(self, field, value)
+        # instances are effectively immutable, so the string forms can be
+        # computed once instead of per comparison (sorts call them N log N times)
+        self._str_tuple = self.tuple_type(*(self._tostr(x) for x in self.params))
+        self._str = '_'.join(self._str_tuple)
 
     @classmethod
     def from_str(cls, s, separator='_'):
@@ -51,27 +74,28 @@ class StringableTuple:
         data.update(kwargs)
         return type(self)(**data)
 
-    def __getattr__(self, item):
-        "if normal attribute getting fails, try to get from params"
-        return getattr(self.params, item)
-
     def __str__(self):
-        return '_'.join(self.str_tuple)
+        return self._str
 
     def __eq__(self, other):
-        return self.str_tuple == other.str_tuple
+        return self._str_tuple == other.str_tuple
 
     def __lt__(self, other):
-        return self.str_tuple < other.str_tuple
+        return self._str_tuple < other.str_tuple
+
+    def __hash__(self):
+        return hash(self._str)
 
     @property
-    def str_tuple(cls):
-        return cls.tuple_type(*(cls._tostr(x) for x in cls.params))
+    def str_tuple(self):
+        return self._str_tuple
 
     # type converters
     @classmethod
     def _fromstr(cls, s, fieldname):
         if fieldname in cls.timestamp_fields:
+            if cls.timestamp_fmt == StringableTuple.timestamp_fmt and len(s) == 12:
+                return _parse_timestamp(s)
             return dt.datetime.strptime(s, cls.timestamp_fmt)
         return s
 
@@ -91,18 +115,26 @@ class NormalizedSceneId(StringableTuple):
     tuple_type = sceneid_params
     timestamp_fields = {'timestamp'}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the derived paths are fixed strings, so build them once here rather
+        # than re-joining per band in the url-construction loops
+        self._dir_path = '/'.join(self._str_tuple)
+        self._scenepath_prefix = self._dir_path + '/' + self._str
+        self._metadata_path = self._scenepath_prefix + '_metadata.json'
+
     @property
     def sceneset_id(self):
         return NormalizedScenesetId(*(getattr(self, attr) for attr in NormalizedScenesetId.tuple_type._fields))
 
     def dir_path(self):
-        return '/'.join(self.str_tuple)
+        return self._dir_path
 
     def scenepath_prefix(self):
-        return '/'.join([self.dir_path(), str(self)])
+        return self._scenepath_prefix
 
     def metadata_path(self):
-        return self.scenepath_prefix() + '_metadata.json'
+        return self._metadata_path
 
     def band_path(self, band):
         return self.scenepath_prefix() + '_{}.tif'.format(band)
@@ -111,7 +143,8 @@ class NormalizedSceneId(StringableTuple):
         return prefix + self.band_path(band)
 
     def band_urls(self, prefix, bands=band_names):
-        return {band: self.band_url(prefix, band) for band in bands}
+        prefix_full = prefix + self._scenepath_prefix
+        return {band: '{}_{}.tif'.format(prefix_full, band) for band in bands}
 
 
 class NormalizedScene:
@@ -134,6 +167,19 @@ class NormalizedScene:
         return hires_tile(self.band_urls[band], tile_coords, zoomlevel,
                           get_tile=get_tile, decode=decode)
 
+    def band_tiles(self, bands, tile_coords, zoomlevel=None,
+                   get_tile=uncached_get_tile, decode=True):
+        """
+        Fetch the tile of several bands concurrently (tile reads are IO bound,
+        so this hides most of the per-band latency).
+        returns {band_name -> tile}
+        """
+        with futures.ThreadPoolExecutor(max_workers=len(bands) or 1) as executor:
+            tiles = {band: executor.submit(self.band_tile, band, tile_coords, zoomlevel,
+                                           get_tile=get_tile, decode=decode)
+                     for band in bands}
+            return {band: tile.result() for band, tile in tiles.items()}
+
 
 class URLScene(NormalizedScene):
     """
@@ -185,7 +231,8 @@ class FilebasedScene(NormalizedScene):
             self._path = os.path.abspath(os.path.dirname(path))
         elif os.path.isdir(path):
             self._path = path
-            fnames = glob.glob(os.path.join(path, '*_metadata.json'))
+            fnames = [entry.path for entry in os.scandir(path)
+                      if entry.is_file() and entry.name.endswith('_metadata.json')]
             assert len(fnames) == 1, 'directory should have a single metadata file'
             self._metadata_path = fnames[0]
 
@@ -198,4 +245,6 @@ class FilebasedScene(NormalizedScene):
 
     @cached_property
     def metadata(self):
-        return json.load(open(self._metadata_path))
+        with open(self._metadata_path, 'rb') as fh:
+            data = fh.read()
+        return orjson.loads(data) if orjson else json.loads(data)
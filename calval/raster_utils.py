@@ -1,6 +1,7 @@
 import numpy as np
 import os.path
 import hashlib
+import threading
 import itertools as it
 import telluric as tl
 from calval.config import cache_dir
@@ -22,6 +23,9 @@ def uncached_get_tile(url, coords):
 class TileCache:
     def __init__(self, folder=os.path.join(cache_dir, 'tiles')):
         self.folder = folder
+        # fetches may run concurrently (see `NormalizedScene.band_tiles`),
+        # so cache writes are serialized to avoid clashing partial saves
+        self._lock = threading.Lock()
         if not os.path.isdir(folder):
             os.makedirs(folder)
 
@@ -32,7 +36,9 @@ class TileCache:
             tile = tl.GeoRaster2.open(path)
         else:
             tile = uncached_get_tile(url, coords)
-            tile.save(path)
+            with self._lock:
+                if not os.path.isfile(path):
+                    tile.save(path)
         return tile
 
 
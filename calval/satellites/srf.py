@@ -21,7 +21,9 @@ class SRF:
         """
         self.start = start
         self.end = end
-        self.response = response
+        # keep the table as an ndarray, so `__call__` interpolates it directly
+        # instead of converting a python list on every evaluation
+        self.response = np.asarray(response, dtype=np.float64)
         self.wavelengths = np.linspace(self.start, self.end, len(self.response))
         self.satellite = satellite or ''
         self.band = band or ''
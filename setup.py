@@ -41,6 +41,9 @@ setup(
         'azure_storage': [
             'azure-storage-blob'
         ],
+        'numba': [
+            'numba'
+        ],
     },
     dependency_links=dependency_links
 )
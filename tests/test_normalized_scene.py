@@ -21,6 +21,8 @@ def test_normalized_scene_id():
     # verify that tags are considered
     scene_id2 = scene_id.copy_with(tag='1')
     assert scene_id != scene_id2
+    # eq/hash contract: equal ids collapse in sets, distinct tags do not
+    assert len({scene_id, scene_id2, NormalizedSceneId.from_str(str(scene_id))}) == 2
 
 
 def test_sceneset_id():
@@ -89,6 +91,13 @@ def test_normalized_scene(module_temp_dir):
     assert normscene['satellite_class'] == 'sentinel2'
     nir_tile = normscene.band_tile('nir', (2446, 1688, 12))
     assert nir_tile.shape == (1, 256, 256)
+    # concurrent fetch returns the same tiles as the per-band calls
+    tiles = normscene.band_tiles(['green', 'nir'], (2446, 1688, 12))
+    assert set(tiles) == {'green', 'nir'}
+    assert np.array_equal(tiles['nir'].image, nir_tile.image)
+    green_tile = normscene.band_tile('green', (2446, 1688, 12))
+    assert np.array_equal(tiles['green'].image, green_tile.image)
+    assert normscene.band_tiles([], (2446, 1688, 12)) == {}
 
 
 @pytest.mark.skipif('azure_blob_prefix' not in config,